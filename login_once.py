@@ -0,0 +1,18 @@
+
+import sys
+
+from token_cache import get_token
+
+# Default operator account used by the vet scripts
+DEFAULT_EMAIL = "analytics_seeds_3lrsx@example.com"
+DEFAULT_PASSWORD = "password123"
+
+if __name__ == "__main__":
+    # Usage: export LMS_TOKEN=$(python login_once.py [email] [password])
+    email = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_EMAIL
+    password = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PASSWORD
+
+    token = get_token(email, password)
+    if not token:
+        sys.exit(1)
+    print(token)
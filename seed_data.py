@@ -1,59 +1,84 @@
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+import numpy as np
+import base64
 import csv
 import random
-import string
 import os
+import asyncio
+import orjson
+import aiohttp
+
+from token_cache import get_token
+from vet_client import bulk_vet, iter_pending
 
 BASE_URL = "http://127.0.0.1:3000"
 
-def generate_random_string(length=10):
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+def random_strings(count, length=10):
+    # One urandom syscall and one base32 pass cover the whole batch instead
+    # of a per-row join over the alphabet
+    blob = os.urandom(count * 16)
+    return [
+        base64.b32encode(blob[i * 16:(i + 1) * 16])[:length].decode()
+        for i in range(count)
+    ]
 
 def generate_questions(count=120):
-    questions = []
-    
     # Headers based on MCQ template
     headers = [
-        'question', 'option_a', 'option_b', 'option_c', 'option_d', 
+        'question', 'option_a', 'option_b', 'option_c', 'option_d',
         'option_correct', 'co', 'lo mapping', 'difficulty', 'marks'
     ]
-    
+
     difficulties = ['Easy', 'Medium', 'Hard']
     cos = ['CO1', 'CO2', 'CO3', 'CO4', 'CO5']
     topics = ['Data Structures', 'Algorithms', 'Database', 'Operating Systems', 'Networks']
-    
-    for i in range(count):
-        is_bad_question = random.random() < 0.1 # 10% bad questions for rejection
-        
-        q_text = f"Sample Question {i+1}: {generate_random_string(20)}?"
-        if is_bad_question:
-            q_text = "Bad Question " + generate_random_string(5)
-            
-        row = {
-            'question': q_text,
-            'option_a': f"Option A {i}",
-            'option_b': f"Option B {i}",
-            'option_c': f"Option C {i}",
-            'option_d': f"Option D {i}",
-            'option_correct': random.choice(['A', 'B', 'C', 'D']),
-            'co': random.choice(cos),
-            'lo mapping': f"LO{random.randint(1,5)}",
-            'difficulty': random.choice(difficulties),
-            'marks': random.choice(['1', '2', '5'])
-        }
-        
-        # Introduce errors for bad questions if needed, but for now we just label them "Bad" 
-        # so we know to reject them in the script logic if we wanted.
-        # Actually, the prompt says "wrong should also be there". 
-        # This implies content errors. Vetting happens manually or via API.
-        
-        questions.append(row)
-        
+
+    # Draw all the per-row randomness up front in bulk instead of making
+    # five-plus random.* calls inside the row loop
+    bad = np.random.random(count) < 0.1 # 10% bad questions for rejection
+    corrects = np.random.choice(['A', 'B', 'C', 'D'], size=count)
+    co_picks = np.random.choice(cos, size=count)
+    lo_picks = np.random.randint(1, 6, size=count)
+    diff_picks = np.random.choice(difficulties, size=count)
+    mark_picks = np.random.choice(['1', '2', '5'], size=count)
+    q_strs = random_strings(count, 20)
+    bad_strs = random_strings(count, 5)
+
+    # Introduce errors for bad questions if needed, but for now we just label them "Bad"
+    # so we know to reject them in the script logic if we wanted.
+    # Actually, the prompt says "wrong should also be there".
+    # This implies content errors. Vetting happens manually or via API.
+    # Rows are tuples in header order so csv.writer can dump them directly.
+    questions = [
+        (
+            ("Bad Question " + bad_strs[i]) if is_bad
+            else f"Sample Question {i+1}: {q_strs[i]}?",
+            f"Option A {i}",
+            f"Option B {i}",
+            f"Option C {i}",
+            f"Option D {i}",
+            correct,
+            co,
+            f"LO{lo}",
+            difficulty,
+            marks
+        )
+        for i, (is_bad, correct, co, lo, difficulty, marks)
+        in enumerate(zip(bad, corrects, co_picks, lo_picks, diff_picks, mark_picks))
+    ]
+
     return headers, questions
 
 def register_user():
-    email = f"analytics_seeds_{generate_random_string(5).lower()}@example.com"
+    email = f"analytics_seeds_{random_strings(1, 5)[0].lower()}@example.com"
     password = "password123"
     name = "Analytics Seeder"
     
@@ -73,7 +98,8 @@ def register_user():
 
     # Register
     try:
-        resp = requests.post(f"{BASE_URL}/auth/signup", json=payload, timeout=10)
+        resp = SESSION.post(f"{BASE_URL}/auth/signup", data=orjson.dumps(payload),
+                            headers={'Content-Type': 'application/json'}, timeout=10)
         if resp.status_code == 201 or resp.status_code == 200:
             print("Registration success.", flush=True)
             return email, password
@@ -84,39 +110,26 @@ def register_user():
         print(f"Registration unexpected error: {e}", flush=True)
         return None, None
 
-def login(email, password):
-    print(f"Logging in...", flush=True)
-    payload = {
-        "email": email,
-        "password": password
-    }
-    try:
-        resp = requests.post(f"{BASE_URL}/auth/signin", json=payload, timeout=10)
-        if resp.status_code == 200 or resp.status_code == 201:
-            print("Login success.", flush=True)
-            return resp.json().get('accessToken')
-        else:
-            print(f"Login failed: {resp.text}", flush=True)
-            return None
-    except Exception as e:
-        print(f"Login error: {e}", flush=True)
-        return None
-
 def upload_csv(token, filename):
     print(f"Uploading CSV...", flush=True)
-    headers = {'Authorization': f'Bearer {token}'}
-    
+
     try:
         with open(filename, 'rb') as f:
-            files = {'file': (filename, f, 'text/csv')}
-            data = {
+            # MultipartEncoder streams the body from the file handle instead of
+            # buffering the whole multipart payload in memory first
+            m = MultipartEncoder(fields={
+                'file': (filename, f, 'text/csv'),
                 'course_code': 'PYTHON',
                 'topic': 'Recursion'
+            })
+            headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': m.content_type
             }
-            resp = requests.post(f"{BASE_URL}/questions/upload", headers=headers, files=files, data=data, timeout=30)
-            
+            resp = SESSION.post(f"{BASE_URL}/questions/upload", headers=headers, data=m, timeout=30)
+
         if resp.status_code == 201:
-            print(f"Upload successful: {resp.json()}", flush=True)
+            print(f"Upload successful: {orjson.loads(resp.content)}", flush=True)
             return True
         else:
             print(f"Upload failed: {resp.text}", flush=True)
@@ -125,52 +138,32 @@ def upload_csv(token, filename):
         print(f"Upload error: {e}", flush=True)
         return False
 
-def vet_questions(token, count=30):
+async def vet_questions(token, count=30):
     print(f"Vetting {count} questions...", flush=True)
     headers = {'Authorization': f'Bearer {token}'}
-    
+
     vetted = 0
     page_size = 50
-    
+
     try:
-        while vetted < count:
-            limit = min(page_size, count - vetted)
-            # Using the new limit support!
-            resp = requests.get(f"{BASE_URL}/questions/vetting?limit={page_size}", headers=headers, timeout=10)
-            
-            if resp.status_code != 200:
-                print(f"Failed to fetch questions: {resp.text}", flush=True)
-                break
-                
-            data = resp.json()
-            questions = data.get('questions', [])
-            
-            if not questions:
-                print("No more questions to vet.", flush=True)
-                break
-                
-            for q in questions:
+        connector = aiohttp.TCPConnector(limit=64)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout,
+                                 json_serialize=lambda o: orjson.dumps(o).decode()) as session:
+            async for questions in iter_pending(session, page_size):
+                items = [
+                    {
+                        'id': q['_id'],
+                        'action': 'reject' if 'Bad' in q['question_text']
+                                  else random.choice(['accept', 'reject']),
+                        'reason': 'Seeding script auto-vet'
+                    }
+                    for q in questions[:count - vetted]
+                ]
+                vetted += await bulk_vet(session, items)
+                # Break before the generator resumes and fetches the next page
                 if vetted >= count:
                     break
-                    
-                q_id = q['_id']
-                # Random action
-                action = random.choice(['accept', 'reject'])
-                if 'Bad' in q['question_text']:
-                     action = 'reject'
-                
-                payload = {
-                    'action': action,
-                    'reason': 'Seeding script auto-vet'
-                }
-                
-                vet_resp = requests.post(f"{BASE_URL}/questions/{q_id}/vet", headers=headers, json=payload, timeout=10)
-                
-                if vet_resp.status_code == 201:
-                    print(f"Vetted {q_id}: {action}", flush=True)
-                    vetted += 1
-                else:
-                    print(f"Failed to vet {q_id}: {vet_resp.text}", flush=True)
 
         print(f"\nTotal vetted: {vetted}", flush=True)
     except Exception as e:
@@ -182,8 +175,8 @@ def main():
     headers, rows = generate_questions(120)
     
     with open(filename, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(headers)
         writer.writerows(rows)
         
     print(f"Generated {filename} with 120 questions.")
@@ -193,8 +186,8 @@ def main():
     if not email:
         return
         
-    # 3. Login
-    token = login(email, password)
+    # 3. Login (token is cached across runs)
+    token = get_token(email, password, session=SESSION)
     if not token:
         return
         
@@ -203,7 +196,7 @@ def main():
         # 5. Vet
         target_vet = random.randint(27, 38)
         print(f"Vetting {target_vet} tasks...")
-        vet_questions(token, target_vet)
+        asyncio.run(vet_questions(token, target_vet))
         
         print("\n" + "="*50)
         print("SEEDING COMPLETE")
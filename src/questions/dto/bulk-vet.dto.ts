@@ -0,0 +1,32 @@
+import { Type } from 'class-transformer';
+import {
+    ArrayMaxSize,
+    ArrayMinSize,
+    IsArray,
+    IsEnum,
+    IsOptional,
+    IsString,
+    ValidateNested,
+} from 'class-validator';
+import { VettingAction } from '../../schemas/question.schema';
+
+export class BulkVetItemDto {
+    @IsString()
+    id: string;
+
+    @IsEnum(VettingAction)
+    action: VettingAction;
+
+    @IsOptional()
+    @IsString()
+    reason?: string;
+}
+
+export class BulkVetDto {
+    @IsArray()
+    @ArrayMinSize(1)
+    @ArrayMaxSize(50)
+    @ValidateNested({ each: true })
+    @Type(() => BulkVetItemDto)
+    actions: BulkVetItemDto[];
+}
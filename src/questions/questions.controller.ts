@@ -12,7 +12,10 @@ import {
     Req,
     Res,
     Delete,
+    Sse,
+    MessageEvent,
 } from '@nestjs/common';
+import { Observable } from 'rxjs';
 import { FileInterceptor } from '@nestjs/platform-express';
 import { InjectModel } from '@nestjs/mongoose';
 import { Model, Types } from 'mongoose';
@@ -37,6 +40,7 @@ import { GenerationService } from './services/generation.service';
 import type { GenerationBlueprint } from './services/generation.service';
 import { UploadResponseDto } from './dto/upload-response.dto';
 import { VetQuestionDto } from './dto/vet-question.dto';
+import { BulkVetDto } from './dto/bulk-vet.dto';
 
 interface AuthenticatedRequest extends Request {
     user: { userId: string; roleId: string };
@@ -226,6 +230,30 @@ export class QuestionsController {
         );
     }
 
+    /**
+     * Stream pending questions for vetting as Server-Sent Events, so clients
+     * subscribe once instead of polling pages
+     */
+    @Sse('vetting/stream')
+    @UseGuards(JwtAuthGuard, RolesGuard)
+    @MinRoleLevel(2) // Teacher and above
+    streamQuestionsForVetting(@Req() req: AuthenticatedRequest): Observable<MessageEvent> {
+        return this.vettingService.streamQuestionsForVetting(req.user.userId);
+    }
+
+    /**
+     * Vet a batch of questions in one round trip (accept/reject/skip per item)
+     */
+    @Post('vet/bulk')
+    @UseGuards(JwtAuthGuard, RolesGuard)
+    @MinRoleLevel(2) // Teacher and above
+    async vetQuestionsBulk(
+        @Body() dto: BulkVetDto,
+        @Req() req: AuthenticatedRequest,
+    ) {
+        return this.vettingService.vetBulk(req.user.userId, dto.actions);
+    }
+
     /**
      * Vet a question (accept/reject/skip)
      */
@@ -1,6 +1,7 @@
-import { Injectable, BadRequestException, NotFoundException } from '@nestjs/common';
+import { Injectable, BadRequestException, NotFoundException, MessageEvent } from '@nestjs/common';
 import { InjectModel } from '@nestjs/mongoose';
 import { Model, Types } from 'mongoose';
+import { Observable } from 'rxjs';
 import {
     Question,
     QuestionDocument,
@@ -25,6 +26,17 @@ export interface VettingResult {
     skip_count: number;
 }
 
+export interface BulkVetItem {
+    id: string;
+    action: VettingAction;
+    reason?: string;
+}
+
+export interface BulkVetResult {
+    vetted: number;
+    results: { id: string; success: boolean; error?: string }[];
+}
+
 @Injectable()
 export class VettingService {
     constructor(
@@ -139,6 +151,31 @@ export class VettingService {
         };
     }
 
+    /**
+     * Vet a batch of questions in one request. Each item goes through the
+     * same checks as a single vet; failures are reported per item instead
+     * of aborting the whole batch.
+     */
+    async vetBulk(userId: string, items: BulkVetItem[]): Promise<BulkVetResult> {
+        const results: BulkVetResult['results'] = [];
+        for (const item of items) {
+            try {
+                await this.vet(item.id, userId, item.action, item.reason);
+                results.push({ id: item.id, success: true });
+            } catch (error) {
+                results.push({
+                    id: item.id,
+                    success: false,
+                    error: error instanceof Error ? error.message : String(error),
+                });
+            }
+        }
+        return {
+            vetted: results.filter((r) => r.success).length,
+            results,
+        };
+    }
+
     /**
      * Get questions for vetting with daily limit enforcement.
      * Returns: questions user already vetted today + new unvetted ones (total capped at limit).
@@ -246,6 +283,75 @@ export class VettingService {
         };
     }
 
+    /**
+     * Push pending questions the user hasn't vetted yet over one SSE
+     * connection. The server polls the collection and emits each question
+     * once, so clients don't re-fetch pages over and over.
+     */
+    streamQuestionsForVetting(userId: string, pollMs = 2000): Observable<MessageEvent> {
+        const userObjectId = new Types.ObjectId(userId);
+        const sent = new Set<string>();
+        const dailyLimit = 50;
+
+        return new Observable<MessageEvent>((subscriber) => {
+            let stopped = false;
+
+            const poll = async () => {
+                while (!stopped) {
+                    try {
+                        // Same budget vet() enforces: count today's votes and
+                        // never push more questions than the user can still vet
+                        const todayStart = new Date();
+                        todayStart.setHours(0, 0, 0, 0);
+                        const vettedToday = await this.questionModel.countDocuments({
+                            'vetting_logs': {
+                                $elemMatch: {
+                                    user_id: userObjectId,
+                                    created_at: { $gte: todayStart },
+                                },
+                            },
+                        });
+                        const remaining = dailyLimit - vettedToday;
+                        if (remaining <= 0) {
+                            subscriber.complete();
+                            return;
+                        }
+
+                        const questions = await this.questionModel
+                            .find({
+                                vetting_status: VettingStatus.PENDING,
+                                'vetting_logs.user_id': { $ne: userObjectId },
+                            })
+                            .select('-embedding -embedding_model')
+                            .sort({ createdAt: -1 })
+                            .limit(50)
+                            .lean();
+
+                        let emitted = 0;
+                        for (const q of questions) {
+                            if (emitted >= remaining) break;
+                            const id = String(q._id);
+                            if (sent.has(id)) continue;
+                            sent.add(id);
+                            if (stopped) return;
+                            subscriber.next({ data: q });
+                            emitted += 1;
+                        }
+                    } catch (error) {
+                        subscriber.error(error);
+                        return;
+                    }
+                    await new Promise((resolve) => setTimeout(resolve, pollMs));
+                }
+            };
+            void poll();
+
+            return () => {
+                stopped = true;
+            };
+        });
+    }
+
     /**
      * Calculate weight delta based on action and duplicate_warning
      */
@@ -106,4 +106,43 @@ describe('VettingService - Weight Logic', () => {
             expect(status).toBe(VettingStatus.PENDING);
         });
     });
+
+    describe('Bulk Vetting', () => {
+        let service: VettingService;
+
+        beforeEach(() => {
+            service = Object.create(VettingService.prototype);
+        });
+
+        it('should vet each item and count successes', async () => {
+            (service as any).vet = jest.fn().mockResolvedValue({ success: true });
+            const result = await service.vetBulk('user1', [
+                { id: 'a', action: VettingAction.ACCEPT },
+                { id: 'b', action: VettingAction.REJECT, reason: 'dup' },
+            ]);
+            expect(result.vetted).toBe(2);
+            expect(result.results).toEqual([
+                { id: 'a', success: true },
+                { id: 'b', success: true },
+            ]);
+        });
+
+        it('should report per-item failures without aborting the batch', async () => {
+            (service as any).vet = jest
+                .fn()
+                .mockRejectedValueOnce(new Error('You have already vetted this question'))
+                .mockResolvedValueOnce({ success: true });
+            const result = await service.vetBulk('user1', [
+                { id: 'a', action: VettingAction.ACCEPT },
+                { id: 'b', action: VettingAction.ACCEPT },
+            ]);
+            expect(result.vetted).toBe(1);
+            expect(result.results[0]).toEqual({
+                id: 'a',
+                success: false,
+                error: 'You have already vetted this question',
+            });
+            expect(result.results[1]).toEqual({ id: 'b', success: true });
+        });
+    });
 });
@@ -0,0 +1,72 @@
+
+import base64
+import orjson
+import os
+import sys
+import time
+
+import requests
+
+BASE_URL = "http://127.0.0.1:3000"
+CACHE_PATH = os.path.expanduser("~/.lms_tokens.json")
+EXPIRY_MARGIN = 60 # seconds; don't reuse a token that is about to expire
+
+def _jwt_exp(token):
+    # Decode the payload segment only - no signature check needed client-side
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return orjson.loads(base64.urlsafe_b64decode(payload)).get('exp', 0)
+    except Exception:
+        return 0
+
+def _load_cache():
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            return orjson.loads(f.read())
+    except Exception:
+        return {}
+
+def _save_cache(cache):
+    try:
+        with open(CACHE_PATH, 'wb') as f:
+            f.write(orjson.dumps(cache))
+    except Exception:
+        pass
+
+def get_token(email, password, name=None, base_url=BASE_URL, session=requests):
+    """Return a still-valid cached token for email, or sign in and cache.
+
+    Signin costs a bcrypt verification server-side plus a round trip, so
+    repeated script runs reuse the token from ~/.lms_tokens.json until its
+    JWT exp claim is close. Pass name to attempt a signup first.
+    """
+    cache = _load_cache()
+    token = cache.get(email)
+    if token and _jwt_exp(token) > time.time() + EXPIRY_MARGIN:
+        return token
+
+    if name:
+        try:
+            session.post(f"{base_url}/auth/signup",
+                         data=orjson.dumps({"name": name, "email": email, "password": password}),
+                         headers={'Content-Type': 'application/json'}, timeout=10)
+        except Exception:
+            pass # Might already exist
+
+    try:
+        resp = session.post(f"{base_url}/auth/signin",
+                            data=orjson.dumps({"email": email, "password": password}),
+                            headers={'Content-Type': 'application/json'}, timeout=10)
+        if resp.status_code == 200 or resp.status_code == 201:
+            token = orjson.loads(resp.content).get('accessToken')
+            if token:
+                cache[email] = token
+                _save_cache(cache)
+            return token
+        # Diagnostics go to stderr: login_once.py's stdout is captured by
+        # vet_all.sh into LMS_TOKEN, so a message here must not end up there
+        print(f"Login failed: {resp.text}", file=sys.stderr, flush=True)
+    except Exception as e:
+        print(f"Login error: {e}", file=sys.stderr, flush=True)
+    return None
@@ -0,0 +1,14 @@
+#!/bin/bash
+
+# Sign in once and share the token with every vet script via LMS_TOKEN,
+# so one operator session pays for a single signin.
+export LMS_TOKEN=$(python login_once.py)
+
+if [ -z "$LMS_TOKEN" ]; then
+  echo "Login failed, aborting."
+  exit 1
+fi
+
+python manual_vet.py
+python multi_user_vet.py
+python mass_vet.py
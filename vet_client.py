@@ -0,0 +1,60 @@
+"""Shared aiohttp helpers for the vetting scripts.
+
+manual_vet, multi_user_vet, mass_vet and seed_data all talk to the same
+bulk-vet and pending-page endpoints; keeping one copy of the client
+logic here stops the scripts drifting apart, the same way token_cache
+holds the shared sign-in path.
+"""
+
+import asyncio
+
+import orjson
+
+BASE_URL = "http://127.0.0.1:3000"
+
+async def vet_post(session, url, payload):
+    # Header-driven backoff: retry on 429 after Retry-After, and only slow
+    # down when X-RateLimit-Remaining says the budget is nearly exhausted.
+    while True:
+        async with session.post(url, json=payload) as resp:
+            if resp.status == 429:
+                await asyncio.sleep(float(resp.headers.get('Retry-After', 1)))
+                continue
+            status = resp.status
+            body = await resp.read()
+            remaining = int(resp.headers.get('X-RateLimit-Remaining', 99))
+            reset_in = float(resp.headers.get('X-RateLimit-Reset', 1))
+        if remaining < 5:
+            await asyncio.sleep(reset_in / max(remaining, 1))
+        return status, body
+
+async def bulk_vet(session, items, base_url=BASE_URL):
+    # One round trip for a whole page of decisions
+    try:
+        status, body = await vet_post(session, f"{base_url}/questions/vet/bulk", {'actions': items})
+        if status == 201:
+            data = orjson.loads(body)
+            for r in data.get('results', []):
+                if not r.get('success'):
+                    print(f"Failed to vet {r.get('id')}: {r.get('error')}", flush=True)
+            return data.get('vetted', 0)
+        print(f"Bulk vet failed: {body}", flush=True)
+    except Exception as e:
+        print(f"Bulk vet error: {e}", flush=True)
+    return 0
+
+async def iter_pending(session, page_size=50, base_url=BASE_URL):
+    # Yield pending questions page by page - exactly one GET per page.
+    # Callers must break right after the batch that reaches their target,
+    # or resuming the generator issues a GET for a page nobody will use.
+    while True:
+        async with session.get(f"{base_url}/questions/vetting?limit={page_size}") as resp:
+            if resp.status != 200:
+                print(f"Failed to fetch questions: {await resp.text()}", flush=True)
+                return
+            data = orjson.loads(await resp.read())
+        questions = data.get('questions', [])
+        if not questions:
+            print("No more questions to vet.", flush=True)
+            return
+        yield questions